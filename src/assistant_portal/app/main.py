@@ -9,9 +9,10 @@ from starlette.templating import Jinja2Templates
 
 from assistant_portal.app.routes import tasks, logs
 from assistant_portal.infra.db.sqlite import make_sqlite_url, make_engine, make_sessionmaker
-from assistant_portal.infra.db.task_repo_sqlite import Base, SQLiteTaskRepo
+from assistant_portal.infra.db.task_repo_sqlite import Base, SQLiteTaskRepo, TaskRow
 from assistant_portal.services.task_service import TaskService
 from assistant_portal.observability.logging import setup_logging
+from assistant_portal.observability.log_broker import log_broker
 from assistant_portal.app.middleware.access_log import AccessLogMiddleware
 from assistant_portal.app.routes import logs_ws
 
@@ -21,7 +22,7 @@ logger = logging.getLogger("assistant.system")
 
 
 def create_app() -> FastAPI:
-    setup_logging()
+    log_listener = setup_logging()
     logger.info("system.start", extra={"category": "system", "event": "system.start"})
 
     app = FastAPI(title="Assistant Portal")
@@ -48,12 +49,22 @@ def create_app() -> FastAPI:
     # Create tables on startup
     @app.on_event("startup")
     async def _startup():
+        log_listener.start()
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips existing tables entirely; add indexes introduced later
+            for index in TaskRow.__table__.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
         logger.info(
             "db.ready",
             extra={"category": "system", "event": "db.ready", "db_path": db_path},
         )
+        log_broker.start()
+
+    @app.on_event("shutdown")
+    async def _shutdown():
+        await log_broker.stop()
+        log_listener.stop()
 
     # Pages
     @app.get("/", response_class=HTMLResponse)
@@ -1,20 +1,31 @@
 import time
 import uuid
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("assistant.access")
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+class AccessLogMiddleware:
+    # Plain ASGI middleware: BaseHTTPMiddleware would add a task group and a
+    # buffered memory stream to every request just to let us read the status.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
         start = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
-        # attach to request for other layers later
-        request.state.request_id = request_id
+        # attach to request for other layers later (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
 
         logger.info(
             "request.start",
@@ -22,15 +33,24 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
                 "category": "http",
                 "event": "request.start",
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query": str(request.url.query),
-                "client": request.client.host if request.client else None,
+                "method": method,
+                "path": path,
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "client": client[0] if client else None,
             },
         )
 
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
         try:
-            response: Response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception:
             duration_ms = round((time.perf_counter() - start) * 1000, 2)
             logger.exception(
@@ -39,15 +59,14 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
                     "category": "http",
                     "event": "request.error",
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "duration_ms": duration_ms,
                 },
             )
             raise
 
         duration_ms = round((time.perf_counter() - start) * 1000, 2)
-        response.headers["X-Request-ID"] = request_id
 
         logger.info(
             "request.end",
@@ -55,10 +74,9 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
                 "category": "http",
                 "event": "request.end",
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
                 "duration_ms": duration_ms,
             },
         )
-        return response
\ No newline at end of file
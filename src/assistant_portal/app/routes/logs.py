@@ -1,24 +1,154 @@
 from __future__ import annotations
 
-import json
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from assistant_portal.observability.logging import log_file_path
 
 router = APIRouter(prefix="/api/logs", tags=["logs"])
 
 
-def _log_path() -> Path:
-    log_dir = Path(os.getenv("LOG_DIR", "./logs"))
-    return log_dir / "assistant.jsonl"
+_TAIL_BLOCK_SIZE = 64 * 1024
+# Bytes of NDJSON per streamed chunk. StreamingResponse runs a sync iterator in
+# the threadpool one item at a time, so per-line yields cost a thread hop each.
+_NDJSON_CHUNK_SIZE = 64 * 1024
+
+
+class _LogFileHandle:
+    """Read-only fd on the log file, tagged with the inode it was opened on."""
+
+    def __init__(self, path: Path, fd: int):
+        self.path = path
+        self.fd = fd
+        self.inode = os.fstat(fd).st_ino
+
+    def __del__(self):
+        # Closed once the cache and every in-flight reader have let go of it
+        os.close(self.fd)
+
+
+_handle: Optional[_LogFileHandle] = None
+_handle_lock = threading.Lock()
+
+
+def _log_handle(path: Path) -> _LogFileHandle:
+    """Cached fd for `path`, reopened only when the file was rotated away."""
+    global _handle
+    inode = os.stat(path).st_ino  # FileNotFoundError if the log is missing
+    with _handle_lock:
+        handle = _handle
+        if handle is None or handle.path != path or handle.inode != inode:
+            handle = _handle = _LogFileHandle(path, os.open(path, os.O_RDONLY))
+        return handle
+
+
+def _scan_tail(read_at: Callable[[int, int], bytes], end: int, n: int) -> list[bytes]:
+    # Read fixed-size blocks backwards from `end` until enough newlines are seen
+    pos = end
+    blocks: list[bytes] = []
+    newlines = 0
+    # n + 1 newlines guarantees the first line we keep is complete
+    # (the file normally ends with a trailing newline).
+    while pos > 0 and newlines <= n:
+        size = min(_TAIL_BLOCK_SIZE, pos)
+        pos -= size
+        block = read_at(size, pos)
+        newlines += block.count(b"\n")
+        blocks.append(block)
+
+    blocks.reverse()
+    return b"".join(blocks).splitlines()[-n:]
+
+
+def tail_lines(path: Path, n: int, end: Optional[int] = None) -> list[bytes]:
+    """
+    Return the last `n` lines of `path` as raw bytes, optionally ending at byte
+    offset `end` instead of EOF.
+    The cost scales with `n` instead of the file size. Nothing is decoded;
+    orjson parses bytes directly. Raises FileNotFoundError if `path` is missing.
+    """
+    if n <= 0:
+        return path.read_bytes()[:end].splitlines()
+
+    if hasattr(os, "pread"):
+        handle = _log_handle(path)
+        size = os.fstat(handle.fd).st_size
+        end = size if end is None else min(end, size)
+        return _scan_tail(lambda size, pos: os.pread(handle.fd, size, pos), end, n)
+
+    # No pread (Windows). Don't keep the file open there either: an open handle
+    # makes RotatingFileHandler's rename fail.
+    with path.open("rb", buffering=_TAIL_BLOCK_SIZE) as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size if end is None else min(end, size)
+
+        def read_at(size: int, pos: int) -> bytes:
+            f.seek(pos)
+            return f.read(size)
+
+        return _scan_tail(read_at, end, n)
+
 
+def build_matcher(
+    category: Optional[str],
+    level: Optional[str],
+    request_id: Optional[str],
+    q: Optional[str],
+) -> Callable[..., Optional[dict]]:
+    """
+    Build a per-request line filter that only checks the filters actually set.
+    The returned callable takes the raw line bytes (plus its parsed object, if
+    already known) and gives back the parsed object, or None to skip the line.
+    """
+    # Case-insensitive search without lowercasing a copy of every line
+    pattern = re.compile(re.escape(q.encode("utf-8")), re.IGNORECASE) if q else None
+    level_u = level.upper() if level else None
 
-def _tail_lines(path: Path, n: int) -> list[str]:
-    text = path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-    return lines[-n:] if n > 0 else lines
+    checks: list[Callable[[dict], bool]] = []
+    if category:
+        checks.append(lambda obj: obj.get("category") == category)
+    if level_u:
+        checks.append(lambda obj: str(obj.get("level", "")).upper() == level_u)
+    if request_id:
+        checks.append(lambda obj: obj.get("request_id") == request_id)
+
+    def match(line: bytes, obj: Optional[dict] = None) -> Optional[dict]:
+        # Cheap substring gate on the raw line first; only survivors get parsed.
+        if pattern and not pattern.search(line):
+            return None
+        if obj is None:
+            try:
+                obj = orjson.loads(line)
+            except Exception:
+                return None
+        for check in checks:
+            if not check(obj):
+                return None
+        return obj
+
+    return match
+
+
+def read_matching(
+    path: Path,
+    tail: int,
+    match: Callable[..., Optional[dict]],
+    end: Optional[int] = None,
+) -> list[tuple[bytes, dict]]:
+    """Blocking: read the last `tail` lines and return (raw line, parsed object) for matches."""
+    items = []
+    for line in tail_lines(path, tail, end):
+        obj = match(line)
+        if obj is not None:
+            items.append((line, obj))
+    return items
 
 
 @router.get("")
@@ -29,29 +159,49 @@ def get_logs(
     request_id: Optional[str] = None,
     q: Optional[str] = None,
 ):
-    path = _log_path()
-    if not path.exists():
+    path = log_file_path()
+    tail = max(1, min(tail, 5000))
+    match = build_matcher(category, level, request_id, q)
+    try:
+        items = [obj for _, obj in read_matching(path, tail, match)]
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Log file not found: {path}")
 
+    return {"returned": len(items), "tail": tail, "items": items}
+
+
+@router.get(".ndjson")
+def get_logs_ndjson(
+    tail: int = 300,
+    category: Optional[str] = None,
+    level: Optional[str] = None,
+    request_id: Optional[str] = None,
+    q: Optional[str] = None,
+):
+    """Same filters as GET /api/logs, streamed as one JSON object per line."""
+    path = log_file_path()
     tail = max(1, min(tail, 5000))
-    raw = _tail_lines(path, tail)
+    try:
+        raw = tail_lines(path, tail)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Log file not found: {path}")
 
-    items = []
-    for line in raw:
-        try:
-            obj = json.loads(line)
-        except Exception:
-            continue
-
-        if category and obj.get("category") != category:
-            continue
-        if level and str(obj.get("level", "")).upper() != level.upper():
-            continue
-        if request_id and obj.get("request_id") != request_id:
-            continue
-        if q and q.lower() not in json.dumps(obj).lower():
-            continue
-
-        items.append(obj)
-
-    return {"returned": len(items), "tail": tail, "items": items}
\ No newline at end of file
+    match = build_matcher(category, level, request_id, q)
+
+    def generate():
+        # The raw lines are already valid JSON; no need to re-serialize them
+        batch: list[bytes] = []
+        size = 0
+        for line in raw:
+            if match(line) is None:
+                continue
+            batch.append(line)
+            size += len(line) + 1
+            if size >= _NDJSON_CHUNK_SIZE:
+                yield b"\n".join(batch) + b"\n"
+                batch.clear()
+                size = 0
+        if batch:
+            yield b"\n".join(batch) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
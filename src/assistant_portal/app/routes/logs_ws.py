@@ -1,31 +1,96 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from assistant_portal.app.routes.logs import build_matcher, read_matching
+from assistant_portal.observability.log_broker import LogEntry, LogPosition, log_broker, tail_source
+from assistant_portal.observability.logging import log_file_path
+
 router = APIRouter(tags=["logs"])
 
+# Log items go out as binary frames of NDJSON (one item per line), batched up
+# to this many bytes or this long; errors are sent as JSON text frames.
+_FLUSH_BYTES = 32 * 1024
+_FLUSH_INTERVAL = 0.05
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    # Idle followers never send, so watch the receive side to notice closed clients
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def _forward(websocket: WebSocket, queue: asyncio.Queue[LogEntry], match: Callable[..., Optional[dict]]) -> None:
+    buf = bytearray()
+    while True:
+        line, obj = await queue.get()
+        flush_at = time.monotonic() + _FLUSH_INTERVAL
+        while True:
+            # The raw line is already the JSON we'd send; no need to re-serialize
+            if match(line, obj) is not None:
+                buf += line
+                buf += b"\n"
+            timeout = flush_at - time.monotonic()
+            if len(buf) > _FLUSH_BYTES or timeout <= 0:
+                break
+            try:
+                line, obj = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
 
-def _log_path() -> Path:
-    log_dir = Path(os.getenv("LOG_DIR", "./logs"))
-    return log_dir / "assistant.jsonl"
+        if buf:
+            await websocket.send_bytes(bytes(buf))
+            buf.clear()
 
 
-def _matches(obj: dict, category: Optional[str], level: Optional[str], request_id: Optional[str], q: Optional[str]) -> bool:
-    if category and obj.get("category") != category:
-        return False
-    if level and str(obj.get("level", "")).upper() != level.upper():
-        return False
-    if request_id and obj.get("request_id") != request_id:
-        return False
-    if q and q.lower() not in json.dumps(obj).lower():
-        return False
-    return True
+async def _stream(
+    websocket: WebSocket,
+    path: Path,
+    tail: int,
+    queue: asyncio.Queue[LogEntry],
+    position: Optional[LogPosition],
+    match: Callable[..., Optional[dict]],
+) -> None:
+    # Send initial tail, ending exactly where the queued lines begin
+    tail = max(1, min(tail, 5000))
+    try:
+        source, end = tail_source(path, position)
+        # File read + parsing run in a worker thread so other connections aren't stalled
+        buf = bytearray()
+        for line, _ in await asyncio.to_thread(read_matching, source, tail, match, end):
+            buf += line
+            buf += b"\n"
+            if len(buf) > _FLUSH_BYTES:
+                await websocket.send_bytes(bytes(buf))
+                buf.clear()
+        if buf:
+            await websocket.send_bytes(bytes(buf))
+    except Exception as e:
+        await websocket.send_json({"type": "error", "message": str(e)})
+
+    # Follow new lines from the shared reader
+    receiver = asyncio.create_task(_wait_for_disconnect(websocket))
+    sender = asyncio.create_task(_forward(websocket, queue, match))
+    try:
+        await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+        if sender.done() and not isinstance(sender.exception(), WebSocketDisconnect):
+            try:
+                await websocket.send_json({"type": "error", "message": str(sender.exception())})
+            finally:
+                try:
+                    await websocket.close()
+                except Exception:
+                    pass
+    finally:
+        receiver.cancel()
+        sender.cancel()
 
 
 @router.websocket("/ws/logs")
@@ -39,56 +104,16 @@ async def ws_logs(
 ):
     await websocket.accept()
 
-    path = _log_path()
+    path = log_file_path()
     if not path.exists():
         await websocket.send_json({"type": "error", "message": f"Log file not found: {path}"})
         await websocket.close()
         return
 
-    # Send initial tail
-    tail = max(1, min(tail, 5000))
-    try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()[-tail:]
-        for line in lines:
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if _matches(obj, category, level, request_id, q):
-                await websocket.send_json({"type": "log", "item": obj})
-    except Exception as e:
-        await websocket.send_json({"type": "error", "message": str(e)})
+    match = build_matcher(category, level, request_id, q)
 
-    # Follow file changes (simple "tail -f")
+    queue, position = log_broker.subscribe()
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as f:
-            # Move to end; we already sent tail above
-            f.seek(0, os.SEEK_END)
-
-            while True:
-                line = f.readline()
-                if not line:
-                    await asyncio.sleep(0.25)
-                    continue
-
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    continue
-
-                if _matches(obj, category, level, request_id, q):
-                    await websocket.send_json({"type": "log", "item": obj})
-    except WebSocketDisconnect:
-        return
-    except Exception as e:
-        try:
-            await websocket.send_json({"type": "error", "message": str(e)})
-        finally:
-            try:
-                await websocket.close()
-            except Exception:
-                pass
\ No newline at end of file
+        await _stream(websocket, path, tail, queue, position, match)
+    finally:
+        log_broker.unsubscribe(queue)
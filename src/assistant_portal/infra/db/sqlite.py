@@ -1,7 +1,19 @@
 from __future__ import annotations
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from pathlib import Path
 
+# Applied to every new connection: WAL lets readers run alongside the writer,
+# NORMAL sync is safe under WAL and fsyncs once per commit instead of twice.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-20000",  # ~20MB
+)
+
 def make_sqlite_url(db_path: str) -> str:
     # db_path like "./data/assistant.db"
     p = Path(db_path).resolve()
@@ -9,7 +21,30 @@ def make_sqlite_url(db_path: str) -> str:
     return f"sqlite+aiosqlite:///{p.as_posix()}"
 
 def make_engine(sqlite_url: str):
-    return create_async_engine(sqlite_url, future=True)
+    # Keep connections open across requests so the .db/-wal/-shm files aren't
+    # reopened (and PRAGMAs re-run) on every checkout.
+    # timeout: wait on a locked database instead of failing with SQLITE_BUSY
+    engine = create_async_engine(
+        sqlite_url,
+        future=True,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=1800,
+        pool_pre_ping=False,
+        connect_args={"timeout": 30},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
 
 def make_sessionmaker(engine) -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(engine, expire_on_commit=False)
\ No newline at end of file
+    return async_sessionmaker(engine, expire_on_commit=False)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Any, Mapping, Optional, List
 
-from sqlalchemy import String, Text, DateTime, select
+from sqlalchemy import String, Text, DateTime, Index, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from assistant_portal.domain.task_models import Task, TaskCreate, TaskStatus, TaskPriority, new_task_id
 
 
+# Stored values are always written by us via `.value`, so a plain dict lookup
+# is enough; skips Enum.__call__ for every row read.
+_PRIO = {p.value: p for p in TaskPriority}
+_STATUS = {s.value: s for s in TaskStatus}
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -25,17 +31,30 @@ class TaskRow(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    # list() is newest-first; lets SQLite walk the index instead of sorting
+    __table_args__ = (Index("ix_tasks_created_at_desc", created_at.desc()),)
+
     def to_domain(self) -> Task:
-        return Task(
-            id=self.id,
-            title=self.title,
-            body=self.body,
-            due_at=self.due_at,
-            priority=TaskPriority(self.priority),
-            status=TaskStatus(self.status),
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-        )
+        return _task_from_mapping({c.key: getattr(self, c.key) for c in _COLUMNS})
+
+
+# Every column, in one place; list() selects them as plain Core rows
+# (no ORM identity map or instance state)
+_COLUMNS = tuple(TaskRow.__table__.columns)
+
+
+def _task_from_mapping(row: Mapping[str, Any]) -> Task:
+    # Rows were validated on the way in (TaskCreate); skip re-validation on reads
+    return Task.model_construct(
+        id=row["id"],
+        title=row["title"],
+        body=row["body"],
+        due_at=row["due_at"],
+        priority=_PRIO[row["priority"]],
+        status=_STATUS[row["status"]],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
 
 
 class SQLiteTaskRepo:
@@ -68,6 +87,6 @@ class SQLiteTaskRepo:
 
     async def list(self) -> List[Task]:
         async with self.sessionmaker() as session:
-            res = await session.execute(select(TaskRow).order_by(TaskRow.created_at.desc()))
-            rows = res.scalars().all()
-            return [r.to_domain() for r in rows]
\ No newline at end of file
+            res = await session.execute(select(*_COLUMNS).order_by(TaskRow.created_at.desc()))
+            rows = res.mappings().all()
+            return [_task_from_mapping(r) for r in rows]
\ No newline at end of file
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import orjson
+from watchfiles import awatch
+
+from assistant_portal.observability.logging import log_file_path
+
+logger = logging.getLogger("assistant.system")
+
+# (raw line, parsed object) as published to subscribers
+LogEntry = tuple[bytes, dict]
+# (inode, byte offset) just past the last line published from that file
+LogPosition = tuple[int, int]
+
+# Watcher restart backoff (seconds) after e.g. hitting the inotify watch limit
+_RESTART_MIN_DELAY = 1.0
+_RESTART_MAX_DELAY = 30.0
+
+
+def _read_from(path: Path, offset: int, inode: int) -> bytes:
+    # Opened per read: a handle held open between events would make
+    # RotatingFileHandler's rename fail on Windows.
+    try:
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_ino != inode:
+                return b""
+            f.seek(offset)
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _rolled_over_path(path: Path) -> Path:
+    # Where RotatingFileHandler moves the previous file (see observability.logging)
+    return path.with_name(path.name + ".1")
+
+
+def tail_source(path: Path, position: Optional[LogPosition]) -> tuple[Path, Optional[int]]:
+    """
+    File and end offset a subscriber should read its initial tail from, so the
+    tail stops exactly where the lines queued for it begin.
+    """
+    if position is None:
+        return path, None
+    inode, end = position
+    # The broker may still be finishing a file that has just been rotated away
+    for candidate in (path, _rolled_over_path(path)):
+        try:
+            if os.stat(candidate).st_ino == inode:
+                return candidate, end
+        except FileNotFoundError:
+            pass
+    return path, None
+
+
+class LogBroker:
+    """
+    Tails assistant.jsonl once and fans parsed lines out to every subscriber.
+    Each live log viewer gets its own bounded queue; slow viewers drop their
+    oldest entries instead of holding up everyone else. The file is only
+    watched while at least one viewer is subscribed.
+    """
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue[LogEntry]] = set()
+        self._path: Optional[Path] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._position: Optional[LogPosition] = None
+        # Watchers that haven't exited yet, including halted ones still winding down
+        self._tasks: set[asyncio.Task] = set()
+
+    def subscribe(self) -> tuple[asyncio.Queue[LogEntry], Optional[LogPosition]]:
+        """
+        Register a viewer. Also returns the position every line on the queue comes
+        after; None if the broker isn't running or the log doesn't exist yet.
+        """
+        queue: asyncio.Queue[LogEntry] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._path is not None and self._stop is None:
+            self._launch()
+        return queue, self._position
+
+    def unsubscribe(self, queue: asyncio.Queue[LogEntry]) -> None:
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self._halt()
+
+    def start(self) -> None:
+        if self._path is not None:
+            return
+        self._path = log_file_path()
+        if self._subscribers:
+            self._launch()
+
+    async def stop(self) -> None:
+        self._path = None
+        self._halt()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _launch(self) -> None:
+        # Only new lines are streamed; viewers read their own initial tail up to here
+        try:
+            st = os.stat(self._path)
+            self._position = (st.st_ino, st.st_size)
+        except FileNotFoundError:
+            self._position = None
+        self._stop = asyncio.Event()
+        task = asyncio.create_task(self.run(self._path, self._stop, self._position))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _halt(self) -> None:
+        # The watcher notices its stop event and exits on its own
+        if self._stop is not None:
+            self._stop.set()
+        self._stop = None
+        self._position = None
+
+    def _publish(self, line: bytes) -> None:
+        try:
+            obj = orjson.loads(line)
+        except Exception:
+            return
+
+        entry = (line, obj)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()  # drop oldest
+            queue.put_nowait(entry)
+
+    async def run(self, path: Path, stop: asyncio.Event, start: Optional[LogPosition]) -> None:
+        inode: Optional[int]
+        inode, offset = start if start is not None else (None, 0)
+        pending = b""
+
+        backoff = _RESTART_MIN_DELAY
+        # inode/offset/pending survive a restart, so nothing written meanwhile is lost
+        while not stop.is_set():
+            try:
+                async for _ in awatch(
+                    path.parent,
+                    watch_filter=lambda _change, changed: Path(changed).name == path.name,
+                    debounce=250,
+                    stop_event=stop,
+                ):
+                    if stop.is_set():
+                        return  # a newer watcher may already be publishing
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue  # not recreated yet; pick it up on the next event
+
+                    data = pending
+                    if inode is not None and (st.st_ino != inode or st.st_size < offset):
+                        # Rotated (or truncated): finish the old file, then start the new one from 0
+                        data += _read_from(_rolled_over_path(path), offset, inode) + b"\n"
+                        offset = 0
+                    inode = st.st_ino
+
+                    chunk = _read_from(path, offset, inode)
+                    offset += len(chunk)
+                    data += chunk
+
+                    # Keep a trailing partial line until the writer finishes it
+                    *complete, pending = data.split(b"\n")
+                    for line in complete:
+                        line = line.strip()
+                        if line:
+                            self._publish(line)
+                    # pending always belongs to the current file (rotation inserts a break above)
+                    self._position = (inode, offset - len(pending))
+                    backoff = _RESTART_MIN_DELAY
+            except Exception:
+                logger.exception(
+                    "logs.broker.error",
+                    extra={"category": "system", "event": "logs.broker.error", "retry_in_s": backoff},
+                )
+                try:
+                    await asyncio.wait_for(stop.wait(), backoff)
+                except asyncio.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, _RESTART_MAX_DELAY)
+
+
+log_broker = LogBroker()
@@ -3,16 +3,30 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+
+# LogRecord attributes that aren't ours; everything else on a record is an extra
+_LOG_BUILTINS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
+    "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread", "threadName", "processName",
+    "process", "message",
+})
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            # record time, not format time: formatting happens later on the listener thread.
+            # orjson renders it as ISO-8601 with a "Z" suffix (OPT_UTC_Z).
+            "ts": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
@@ -21,27 +35,78 @@ class JsonFormatter(logging.Formatter):
         # Pull structured extras (we always log with `extra={...}`)
         # Record has lots of builtin attrs—only include our extras.
         for k, v in record.__dict__.items():
-            if k in (
-                "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
-                "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName",
-                "created", "msecs", "relativeCreated", "thread", "threadName", "processName",
-                "process", "message"
-            ):
+            if k in _LOG_BUILTINS:
                 continue
             payload[k] = v
 
         if record.exc_info:
             payload["exc"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, ensure_ascii=False)
+        try:
+            # OPT_NON_STR_KEYS: extras like {1: 2} are written as {"1": 2}, as json did
+            return orjson.dumps(
+                payload, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # e.g. ints wider than 64 bits, which orjson rejects without calling default;
+            # never drop the record over an extra
+            payload["ts"] = payload["ts"].isoformat().replace("+00:00", "Z")
+            return json.dumps(payload, ensure_ascii=False, default=str)
 
 
-def setup_logging() -> None:
-    level = os.getenv("LOG_LEVEL", "INFO").upper()
-    log_dir = Path(os.getenv("LOG_DIR", "./logs"))
-    log_dir.mkdir(parents=True, exist_ok=True)
+def log_file_path() -> Path:
+    """The JSONL file the app logs to (and the logs routes read from)."""
+    return Path(os.getenv("LOG_DIR", "./logs")) / "assistant.jsonl"
+
+
+class _LocalQueueHandler(QueueHandler):
+    # The listener runs in this process, so the record doesn't need to be made
+    # picklable; hand it over untouched and let JsonFormatter run on the listener
+    # thread instead of the caller's (event loop) thread.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _RootQueueListener(QueueListener):
+    """
+    While running, root only enqueues and this listener's thread does the
+    formatting and console/file I/O. Stopped (or never started), root writes
+    through the real handlers directly, so nothing piles up in the queue.
+    """
 
-    log_path = log_dir / "assistant.jsonl"
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord], *handlers: logging.Handler):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._queue_handler = _LocalQueueHandler(log_queue)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return  # already running (e.g. a second startup)
+        super().start()
+        root = logging.getLogger()
+        for handler in self.handlers:
+            root.removeHandler(handler)
+        root.addHandler(self._queue_handler)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        # Swap back first so records logged while the queue drains still get written
+        root = logging.getLogger()
+        root.removeHandler(self._queue_handler)
+        for handler in self.handlers:
+            root.addHandler(handler)
+        super().stop()
+
+
+def setup_logging() -> QueueListener:
+    """
+    Configure root logging. Until the returned listener is started, records are
+    written directly; start it (on app startup) to move formatting and I/O off
+    the caller's thread, and stop it on shutdown to flush and switch back.
+    """
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    log_path = log_file_path()
+    log_path.parent.mkdir(parents=True, exist_ok=True)
 
     root = logging.getLogger()
     root.setLevel(level)
@@ -64,6 +129,13 @@ def setup_logging() -> None:
     file_handler.setFormatter(fmt)
     root.addHandler(file_handler)
 
+    listener = _RootQueueListener(queue.Queue(-1), console, file_handler)
+
     # Silence uvicorn access logs; we do our own in middleware
     logging.getLogger("uvicorn.access").setLevel(logging.CRITICAL)
-    logging.getLogger("uvicorn.error").setLevel(level)
\ No newline at end of file
+    logging.getLogger("uvicorn.error").setLevel(level)
+    # watchfiles logs every change at INFO; the log broker watches our own log
+    # file, so those records would keep retriggering it
+    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+
+    return listener
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Optional
 from assistant_portal.domain.task_models import Task, TaskCreate
@@ -7,13 +8,26 @@ logger = logging.getLogger("assistant.tasks")
 class TaskService:
     def __init__(self, repo):
         self.repo = repo
+        # Result of the last list_tasks(); dropped on every write
+        self._list_cache: Optional[List[Task]] = None
+        self._cache_lock = asyncio.Lock()
 
     async def create_task(self, data: TaskCreate) -> Task:
         logger.info("task.create", extra={"category": "tasks", "event": "task.create", "title": data.title})
-        return await self.repo.create(data)
+        task = await self.repo.create(data)
+        # Taken after the commit so a list() that raced with it can't leave a stale cache behind
+        async with self._cache_lock:
+            self._list_cache = None
+        return task
 
     async def get_task(self, task_id: str) -> Optional[Task]:
         return await self.repo.get(task_id)
 
     async def list_tasks(self) -> List[Task]:
-        return await self.repo.list()
\ No newline at end of file
+        cached = self._list_cache
+        if cached is None:
+            async with self._cache_lock:
+                if self._list_cache is None:
+                    self._list_cache = await self.repo.list()
+                cached = self._list_cache
+        return list(cached)
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+from assistant_portal.app.routes.logs import tail_lines
+from assistant_portal.observability.log_broker import LogBroker, tail_source
+
+WATCH_SETTLE = 0.3  # let the watcher register before writing
+TIMEOUT = 5
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    path = tmp_path / "assistant.jsonl"
+    path.write_bytes(b"")
+    return path
+
+
+def _append(path, data: bytes) -> None:
+    with path.open("ab") as f:
+        f.write(data)
+
+
+async def _take(queue, n):
+    return [(await asyncio.wait_for(queue.get(), TIMEOUT))[1] for _ in range(n)]
+
+
+def test_watcher_only_runs_with_subscribers(log_path):
+    async def scenario():
+        broker = LogBroker()
+        broker.start()
+        assert not broker._tasks
+
+        queue, _ = broker.subscribe()
+        assert len(broker._tasks) == 1
+
+        broker.unsubscribe(queue)
+        await asyncio.sleep(WATCH_SETTLE)
+        assert not broker._tasks
+        await broker.stop()
+
+    asyncio.run(scenario())
+
+
+def test_partial_lines_are_held_until_complete(log_path):
+    async def scenario():
+        broker = LogBroker()
+        broker.start()
+        queue, _ = broker.subscribe()
+        await asyncio.sleep(WATCH_SETTLE)
+
+        _append(log_path, b'{"i": 1}\n{"i": ')
+        assert await _take(queue, 1) == [{"i": 1}]
+        await asyncio.sleep(WATCH_SETTLE)
+        assert queue.empty()
+
+        _append(log_path, b'2}\n')
+        assert await _take(queue, 1) == [{"i": 2}]
+        await broker.stop()
+
+    asyncio.run(scenario())
+
+
+def test_truncation_restarts_from_the_top(log_path):
+    async def scenario():
+        _append(log_path, b'{"i": 0}\n' * 20)
+        broker = LogBroker()
+        broker.start()
+        queue, _ = broker.subscribe()
+        await asyncio.sleep(WATCH_SETTLE)
+
+        with log_path.open("wb") as f:  # same inode, smaller size
+            f.write(b'{"i": 1}\n')
+        assert await _take(queue, 1) == [{"i": 1}]
+        await broker.stop()
+
+    asyncio.run(scenario())
+
+
+def test_rotation_delivers_every_line_in_order(log_path):
+    handler = RotatingFileHandler(log_path, maxBytes=200, backupCount=5, encoding="utf-8")
+    handler.setFormatter(logging.Formatter('{"i": %(message)s}'))
+    writer = logging.getLogger("test.log_broker.rotation")
+    writer.propagate = False
+    writer.addHandler(handler)
+    writer.setLevel(logging.INFO)
+
+    async def scenario():
+        broker = LogBroker()
+        broker.start()
+        queue, _ = broker.subscribe()
+        await asyncio.sleep(WATCH_SETTLE)
+
+        for i in range(40):
+            writer.info("%d", i)
+            await asyncio.sleep(0.1)  # at most one rollover per watcher event
+
+        assert [obj["i"] for obj in await _take(queue, 40)] == list(range(40))
+        assert (log_path.parent / "assistant.jsonl.2").exists()  # it really rotated
+        await broker.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        writer.removeHandler(handler)
+        handler.close()
+
+
+def test_rotation_drains_unread_lines_from_the_old_file(log_path):
+    async def scenario():
+        broker = LogBroker()
+        broker.start()
+        queue, _ = broker.subscribe()
+        await asyncio.sleep(WATCH_SETTLE)
+
+        # All within one watcher event: lines 0-2 are only in the rolled-over file
+        _append(log_path, b'{"i": 0}\n{"i": 1}\n{"i": 2}\n')
+        log_path.rename(log_path.parent / "assistant.jsonl.1")
+        log_path.write_bytes(b'{"i": 3}\n{"i": 4}\n')
+
+        assert [obj["i"] for obj in await _take(queue, 5)] == [0, 1, 2, 3, 4]
+        await broker.stop()
+
+    asyncio.run(scenario())
+
+
+def test_initial_tail_ends_where_the_queue_begins(log_path):
+    async def scenario():
+        _append(log_path, b"".join(b'{"i": %d}\n' % i for i in range(5)))
+        broker = LogBroker()
+        broker.start()
+        first, _ = broker.subscribe()  # keeps the watcher running
+        await asyncio.sleep(WATCH_SETTLE)
+
+        # Written but not yet published when the second viewer joins
+        _append(log_path, b'{"i": 5}\n{"i": 6}\n')
+        queue, position = broker.subscribe()
+        source, end = tail_source(log_path, position)
+        assert end == os.stat(log_path).st_size - len(b'{"i": 5}\n{"i": 6}\n')
+        assert tail_lines(source, 2, end) == [b'{"i": 3}', b'{"i": 4}']
+
+        assert await _take(queue, 2) == [{"i": 5}, {"i": 6}]
+        broker.unsubscribe(first)
+        await broker.stop()
+
+    asyncio.run(scenario())
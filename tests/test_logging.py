@@ -0,0 +1,35 @@
+import json
+import logging
+
+import pytest
+
+from assistant_portal.observability.logging import JsonFormatter
+
+
+def _format(**extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+    record.__dict__.update(extra)
+    return json.loads(JsonFormatter().format(record))
+
+
+def test_extras_are_included():
+    out = _format(category="http", request_id="abc")
+    assert out["msg"] == "hello"
+    assert out["category"] == "http"
+    assert out["request_id"] == "abc"
+    assert out["ts"].endswith("Z")
+
+
+@pytest.mark.parametrize(
+    "extra, expected",
+    [
+        ({1: 2}, {"1": 2}),
+        (2**70, 2**70),
+        ({"nested": [2**64]}, {"nested": [2**64]}),
+        (object, str(object)),
+    ],
+)
+def test_awkward_extras_do_not_drop_the_record(extra, expected):
+    out = _format(n=extra)
+    assert out["n"] == expected
+    assert out["ts"].endswith("Z")
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import random
+
+import pytest
+
+from assistant_portal.app.routes import logs
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Tiny blocks so every case crosses several block boundaries
+    monkeypatch.setattr(logs, "_TAIL_BLOCK_SIZE", 7)
+
+
+def _random_log(rng: random.Random) -> bytes:
+    lines = [b"x" * rng.randint(0, 20) for _ in range(rng.randint(0, 30))]
+    data = b"\n".join(lines)
+    if lines and rng.random() < 0.7:
+        data += b"\n"
+    return data
+
+
+def test_tail_matches_splitlines_fuzz(tmp_path, small_blocks):
+    rng = random.Random(1234)
+    path = tmp_path / "assistant.jsonl"
+    for _ in range(3000):
+        data = _random_log(rng)
+        path.write_bytes(data)
+        n = rng.randint(1, 40)  # often more than the file has
+        assert logs.tail_lines(path, n) == data.splitlines()[-n:]
+
+        end = rng.randint(0, len(data))
+        assert logs.tail_lines(path, n, end) == data[:end].splitlines()[-n:]
+
+
+def test_tail_without_pread(tmp_path, small_blocks, monkeypatch):
+    monkeypatch.delattr(os, "pread", raising=False)
+    path = tmp_path / "assistant.jsonl"
+    data = b"a\nbb\nccc\ndddd"  # no trailing newline
+    path.write_bytes(data)
+    for n in range(1, 6):
+        assert logs.tail_lines(path, n) == data.splitlines()[-n:]
+    assert logs.tail_lines(path, 2, end=5) == [b"a", b"bb"]
+
+
+def test_tail_empty_and_missing(tmp_path):
+    path = tmp_path / "assistant.jsonl"
+    path.write_bytes(b"")
+    assert logs.tail_lines(path, 10) == []
+    with pytest.raises(FileNotFoundError):
+        logs.tail_lines(tmp_path / "missing.jsonl", 10)
+
+
+@pytest.mark.skipif(not hasattr(os, "pread"), reason="fd cache is only used with os.pread")
+def test_fd_cache_reopens_after_rotation(tmp_path):
+    path = tmp_path / "assistant.jsonl"
+    path.write_bytes(b"one\n")
+    assert logs.tail_lines(path, 5) == [b"one"]
+    handle = logs._handle
+
+    # Appends keep using the same descriptor
+    with path.open("ab") as f:
+        f.write(b"two\n")
+    assert logs.tail_lines(path, 5) == [b"one", b"two"]
+    assert logs._handle is handle
+
+    # Rotation (rename away + fresh file) is picked up via the inode change
+    path.rename(tmp_path / "assistant.jsonl.1")
+    path.write_bytes(b"three\n")
+    assert logs.tail_lines(path, 5) == [b"three"]
+    assert logs._handle is not handle
+    assert logs._handle.inode == os.stat(path).st_ino
+
+
+def test_ndjson_streams_matches_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(logs, "_NDJSON_CHUNK_SIZE", 100)
+    lines = [b'{"i": %d, "level": "%s"}' % (i, b"INFO" if i % 3 else b"ERROR") for i in range(50)]
+    (tmp_path / "assistant.jsonl").write_bytes(b"\n".join(lines) + b"\n")
+
+    async def collect(iterator):
+        return [chunk async for chunk in iterator]
+
+    response = logs.get_logs_ndjson(tail=5000, level="error")
+    chunks = asyncio.run(collect(response.body_iterator))
+    assert b"".join(chunks) == b"".join(line + b"\n" for line in lines if b"ERROR" in line)
+    assert 1 < len(chunks) < 17  # batched, not one chunk per line
+    assert all(chunk.endswith(b"\n") for chunk in chunks)